@@ -1,176 +1,552 @@
 import zipfile
+import io
 import os
 import shutil
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 from tkinter import ttk
 
-def copy_to_extracted_folder(source_folder, extraction_base_path):
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# Output folder created inside the folder selected by the user, and the staging
+# folder earlier versions extracted into, both skipped when reading the source
+MERGED_FOLDER_NAME = 'Merged'
+EXTRACTED_FOLDER_NAME = 'Extracted'
+
+# Extensions of the files collected in the merged folder, with their folder and file type
+MERGED_FILE_TYPES = {
+    'csv': ('All_CSVs', 'CSV'),
+    'pdf': ('All_PDFs', 'PDF'),
+}
+
+# Extensions of the archives that are extracted
+ZIP_EXTENSIONS = {'zip'}
+
+# Size of the buffer used to write out ZIP members
+COPY_BUFFER_SIZE = 1 << 20
+
+# Number of threads copying source files into the merged folder, and how many
+# files the directory walk may queue up ahead of them
+COPY_WORKERS = 8
+COPY_QUEUE_SIZE = 256
+
+# Progress counters, updated from the worker threads and shown by _drain_updates
+progress_lock = threading.Lock()
+completed_tasks = 0
+total_tasks = 0
+
+# ioctl request that clones a file's extents (reflink) on btrfs and XFS
+FICLONE = getattr(fcntl, 'FICLONE', 0x40049409)
+
+def file_extension(file_name):
     """
-    Copies all folders and .zip files from the source folder to the extraction base path.
+    Gets the extension of a file name, lowercased so that '.CSV' matches 'csv'.
 
     Parameters:
-    source_folder (str): The original folder selected by the user.
-    extraction_base_path (str): The base path where files and folders will be copied.
+    file_name (str): The file name.
+
+    Returns:
+    str: The extension without the dot, or an empty string if there is none.
     """
-    # Ensure the extraction folder exists
-    if not os.path.exists(extraction_base_path):
-        os.makedirs(extraction_base_path)
+    _, dot, extension = file_name.rpartition('.')
+    return extension.lower() if dot else ''
 
-    for item in os.listdir(source_folder):
-        full_path = os.path.join(source_folder, item)
-        destination_path = os.path.join(extraction_base_path, item)
+def scan_folder(folder_path):
+    """
+    Lists the entries of a folder. A folder that cannot be read is logged and
+    treated as empty, like os.walk does, so one bad folder does not stop the run.
 
-        try:
-            if os.path.isdir(full_path):
-                # Copy folder to the extracted directory
-                shutil.copytree(full_path, destination_path, dirs_exist_ok=True)
-                log_message(f"Copied folder '{full_path}' to '{destination_path}'.")
-                update_progress()
+    Parameters:
+    folder_path (str): The folder to list.
 
-            elif os.path.isfile(full_path) and full_path.endswith('.zip'):
-                # Copy ZIP file to the extracted directory
-                shutil.copy2(full_path, destination_path)
-                log_message(f"Copied ZIP file '{full_path}' to '{destination_path}'.")
-                update_progress()
+    Returns:
+    list: The os.DirEntry objects of the folder.
+    """
+    try:
+        with os.scandir(folder_path) as it:
+            return list(it)
 
-        except Exception as e:
-            log_message(f"Error while copying '{full_path}' to '{destination_path}': {e}")
+    except OSError as e:
+        log_message(f"Error while reading '{folder_path}': {e}. Skipping...")
+        return []
 
-def find_and_extract_zip_files(extraction_base_path):
+def iter_files(base_path):
     """
-    Iteratively finds all .zip files in the specified folder, extracts them,
-    within the extraction base path.
+    Iteratively walks a folder and its subfolders using os.scandir, yielding every file found.
 
     Parameters:
-    extraction_base_path (str): The base path where extracted folders are located.
+    base_path (str): The folder to walk.
+
+    Yields:
+    tuple: The full path and the name of each file.
     """
-    # Use a stack to manage folders to process
-    stack = [extraction_base_path]
+    stack = [base_path]
 
     while stack:
         current_path = stack.pop()
 
-        for item in os.listdir(current_path):
-            # Construct the full path of the file or folder
-            full_path = os.path.join(current_path, item)
+        for entry in scan_folder(current_path):
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path, entry.name
+
+@contextmanager
+def partial_file(target_path):
+    """
+    Yields a temporary path next to a target file. Once the block completes the temporary
+    file replaces the target in one step, so threads writing files of the same name never
+    mix their data. The temporary file is removed if the block fails.
+
+    Parameters:
+    target_path (str): The file that will be replaced.
+
+    Yields:
+    str: The temporary path to write to.
+    """
+    partial_path = f"{target_path}.{threading.get_ident()}.part"
+    try:
+        yield partial_path
+        os.replace(partial_path, target_path)
+    except BaseException:
+        try:
+            os.remove(partial_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+def kernel_copy(src_fd, dst_fd, size):
+    """
+    Copies data between two open files with os.copy_file_range, so it never
+    passes through user space.
+
+    Parameters:
+    src_fd (int): The file descriptor to read from.
+    dst_fd (int): The file descriptor to write to.
+    size (int): The number of bytes to copy.
+    """
+    while size > 0:
+        copied = os.copy_file_range(src_fd, dst_fd, size)
+        if copied == 0:
+            break
+        size -= copied
 
+def clone_or_copy(src, dst):
+    """
+    Creates a new file with the contents of another. On Linux the data stays in the
+    kernel: a reflink (copy-on-write clone) where the filesystem supports it, otherwise
+    an in-kernel copy. Other platforms, and filesystems refusing both, use a regular copy.
+
+    Parameters:
+    src (str): The file to copy.
+    dst (str): The path of the new file.
+    """
+    if fcntl is not None and sys.platform.startswith('linux'):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
             try:
-                if os.path.isfile(full_path) and full_path.endswith('.zip'):
-                    # If the item is a ZIP file, extract it in place
-                    extract_to_folder = os.path.join(current_path, os.path.splitext(item)[0])
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                return
+            except OSError:
+                pass
+
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    kernel_copy(fsrc.fileno(), fdst.fileno(), os.fstat(fsrc.fileno()).st_size)
+                    return
+                except OSError:
+                    # Not supported between these filesystems
+                    pass
+
+    # copyfile skips the permission copy and uses the kernel's sendfile fast path
+    shutil.copyfile(src, dst)
+
+def fast_copy(src, dst):
+    """
+    Copies a file, preferring a reflink on Linux so no data is copied,
+    and a regular copy as a last resort. Hard links are not used, since they
+    would make the merged file the same file as the original.
+    Safe to call from several threads at once, even for the same destination.
 
-                    # Check if the extraction folder exists, if not create it
-                    if not os.path.exists(extract_to_folder):
-                        os.makedirs(extract_to_folder)
+    Parameters:
+    src (str): The file to copy.
+    dst (str): The destination file path, replaced if it already exists.
 
-                    # Extract the ZIP file
-                    with zipfile.ZipFile(full_path, 'r') as zip_ref:
-                        zip_ref.extractall(extract_to_folder)
-                        log_message(f"Successfully extracted '{full_path}' to '{extract_to_folder}'.")
-                        update_progress()
+    Returns:
+    str: The destination file path.
+    """
+    # Write through a partial file so concurrent copies to the same name never mix
+    with partial_file(dst) as partial_path:
+        clone_or_copy(src, partial_path)
+    return dst
 
-                    # Add the newly extracted folder to the stack for further processing
-                    stack.append(extract_to_folder)
+def iter_source_files(source_folder):
+    """
+    Yields the files to process from the folder selected by the user: the .zip files
+    at its top level and every file in its subfolders. The output folders are skipped.
 
-                elif os.path.isdir(full_path):
-                    # If it's a folder, add it to the stack to process its contents
-                    stack.append(full_path)
+    Parameters:
+    source_folder (str): The original folder selected by the user.
 
-            except FileNotFoundError as e:
-                log_message(f"Error: File not found '{e.filename}'. Skipping...")
+    Yields:
+    tuple: The full path and the name of each file.
+    """
+    with os.scandir(source_folder) as it:
+        entries = list(it)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in (EXTRACTED_FOLDER_NAME, MERGED_FOLDER_NAME):
+                yield from iter_files(entry.path)
+
+        elif entry.is_file(follow_symlinks=False) and file_extension(entry.name) in ZIP_EXTENSIONS:
+            yield entry.path, entry.name
+
+def member_file_name(member_name):
+    """
+    Gets the file name of a ZIP member without its folders or drive letter, so the member
+    cannot be written outside the folder it is extracted to.
+
+    Parameters:
+    member_name (str): The name of the member inside the ZIP file.
+
+    Returns:
+    str: The file name, or an empty string if the name cannot be used safely.
+    """
+    # Drop the drive letter first, then the folders
+    file_name = os.path.splitdrive(member_name.replace('\\', '/'))[1]
+    file_name = file_name.rpartition('/')[2]
+
+    # A remaining ':' would name a drive or an NTFS alternate data stream on Windows
+    if ':' in file_name:
+        return ''
+    return file_name
+
+def copy_stream(src, dst, buffer):
+    """
+    Copies a file object into another through a reusable buffer.
+
+    Parameters:
+    src (file): The file object to read from.
+    dst (file): The file object to write to.
+    buffer (memoryview): The buffer to read into.
+    """
+    while True:
+        size = src.readinto(buffer)
+        if not size:
+            break
+        dst.write(buffer[:size])
+
+def write_member(zip_ref, member, target_path, buffer):
+    """
+    Writes a ZIP member to a file.
+
+    Parameters:
+    zip_ref (ZipFile): The open ZIP file.
+    member (ZipInfo): The member to write.
+    target_path (str): The file to write the member to.
+    buffer (memoryview): The buffer to copy the data through.
+    """
+    with zip_ref.open(member) as src, open(target_path, 'wb') as dst:
+        copy_stream(src, dst, buffer)
+
+def extract_zip_members(zip_ref, zip_name, merged_folders, buffer):
+    """
+    Writes the .csv and .pdf members of an open ZIP file straight to their folders in the
+    merged directory, descending into nested .zip files from memory. Other members are skipped.
+
+    Parameters:
+    zip_ref (ZipFile): The open ZIP file.
+    zip_name (str): The name of the ZIP file, for logging.
+    merged_folders (dict): The folder and file type collecting each merged file extension.
+    buffer (memoryview): The buffer to copy the data through.
+    """
+    # Count the CSV and PDF files this ZIP file will produce
+    extend_progress(sum(1 for name in zip_ref.namelist() if file_extension(member_file_name(name)) in merged_folders))
+
+    for member in zip_ref.infolist():
+        if member.is_dir():
+            continue
+
+        # Only a safe file name is kept, so members cannot be written outside the merged folders.
+        # Unsafe names have no extension and are skipped with the other members
+        file_name = member_file_name(member.filename)
+        extension = file_extension(file_name)
+
+        if extension in ZIP_EXTENSIONS:
+            nested_zip_name = f"{zip_name}/{member.filename}"
+
+            try:
+                # Parse the nested ZIP file from memory while its parent is still open,
+                # so only one nested ZIP file per level is held in memory at a time
+                with zipfile.ZipFile(io.BytesIO(zip_ref.read(member)), 'r') as nested_zip_ref:
+                    extend_progress(1)
+                    extract_zip_members(nested_zip_ref, nested_zip_name, merged_folders, buffer)
 
             except zipfile.BadZipFile as e:
-                log_message(f"Error: Bad ZIP file '{full_path}'. Skipping...")
+                log_message(f"Error: Bad ZIP file '{nested_zip_name}'. Skipping...")
 
             except Exception as e:
-                log_message(f"Unexpected error '{e}' occurred with '{full_path}'. Skipping...")
+                log_message(f"Unexpected error '{e}' occurred with '{nested_zip_name}'. Skipping...")
 
-def organize_files_by_extension(extraction_base_path, merged_path):
+            else:
+                log_message(f"Successfully extracted '{nested_zip_name}'.")
+                update_progress()
+            continue
+
+        merged_folder = merged_folders.get(extension)
+        if merged_folder is None:
+            continue
+        destination_folder, file_type = merged_folder
+
+        # Archives extracted in parallel may hold merged files of the same name
+        with partial_file(os.path.join(destination_folder, file_name)) as partial_path:
+            write_member(zip_ref, member, partial_path, buffer)
+        log_message(f"Extracted {file_type} file '{member.filename}' from '{zip_name}' to '{destination_folder}'.")
+        update_progress()
+
+def extract_zip_file(zip_path, merged_folders):
     """
-    Finds all .csv and .pdf files in the extracted folders and subfolders,
-    and copies them to respective folders in the merged directory.
+    Extracts the .csv and .pdf files of a ZIP file and of the ZIP files nested in it
+    straight into their folders in the merged directory.
+    Runs on a worker thread.
 
     Parameters:
-    extraction_base_path (str): The base path where extracted folders are located.
-    merged_path (str): The path where all merged CSV and PDF files will be saved.
+    zip_path (str): The path of the ZIP file.
+    merged_folders (dict): The folder and file type collecting each merged file extension.
     """
-    csv_folder = os.path.join(merged_path, 'All_CSVs')
-    pdf_folder = os.path.join(merged_path, 'All_PDFs')
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        # Count the extraction itself
+        extend_progress(1)
 
-    # Create the destination folders if they do not exist
-    if not os.path.exists(csv_folder):
-        os.makedirs(csv_folder)
-    if not os.path.exists(pdf_folder):
-        os.makedirs(pdf_folder)
+        # Write the members out through one large buffer instead of extractall's small per-member reads
+        buffer = memoryview(bytearray(COPY_BUFFER_SIZE))
+        extract_zip_members(zip_ref, zip_path, merged_folders, buffer)
 
-    # Walk through all folders and subfolders to find .csv and .pdf files
-    for root, _, files in os.walk(extraction_base_path):
-        for file_name in files:
-            file_path = os.path.join(root, file_name)
+def extract_zip_files(source_zip_paths, merged_folders):
+    """
+    Extracts the .csv and .pdf files of the given .zip files in parallel, straight into
+    their folders in the merged directory. Nested .zip files are extracted by the same
+    worker while their parent archive is open.
+
+    Parameters:
+    source_zip_paths (list): The .zip files found in the source folder.
+    merged_folders (dict): The folder and file type collecting each merged file extension.
+    """
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {
+            executor.submit(extract_zip_file, zip_path, merged_folders): zip_path
+            for zip_path in source_zip_paths
+        }
+
+        for future in as_completed(futures):
+            zip_path = futures[future]
 
             try:
-                if file_name.endswith('.csv'):
-                    # Copy .csv files to the All_CSVs folder
-                    shutil.copy(file_path, csv_folder)
-                    log_message(f"Copied CSV file '{file_path}' to '{csv_folder}'.")
-                    update_progress()
-
-                elif file_name.endswith('.pdf'):
-                    # Copy .pdf files to the All_PDFs folder
-                    shutil.copy(file_path, pdf_folder)
-                    log_message(f"Copied PDF file '{file_path}' to '{pdf_folder}'.")
-                    update_progress()
+                future.result()
 
             except FileNotFoundError as e:
                 log_message(f"Error: File not found '{e.filename}'. Skipping...")
 
-            except shutil.Error as e:
-                log_message(f"Error while copying '{file_path}': {e}. Skipping...")
+            except zipfile.BadZipFile as e:
+                log_message(f"Error: Bad ZIP file '{zip_path}'. Skipping...")
 
             except Exception as e:
-                log_message(f"Unexpected error '{e}' occurred with '{file_path}'. Skipping...")
+                log_message(f"Unexpected error '{e}' occurred with '{zip_path}'. Skipping...")
+
+            else:
+                log_message(f"Successfully extracted '{zip_path}'.")
+                update_progress()
+
+def create_merged_folders(merged_path):
+    """
+    Creates the folders collecting the CSV and PDF files in the merged directory.
+
+    Parameters:
+    merged_path (str): The path where all merged CSV and PDF files will be saved.
+
+    Returns:
+    dict: The folder and file type collecting each merged file extension.
+    """
+    merged_folders = {}
+
+    for extension, (folder_name, file_type) in MERGED_FILE_TYPES.items():
+        folder = os.path.join(merged_path, folder_name)
+
+        # Create the destination folder, and the merged folder above it, if they do not exist
+        os.makedirs(folder, exist_ok=True)
+
+        merged_folders[extension] = (folder, file_type)
+
+    return merged_folders
+
+def copy_to_merged_folder(file_path, file_name, destination_folder, file_type):
+    """
+    Copies a CSV or PDF file into its folder in the merged directory.
+    Runs on a worker thread.
+
+    Parameters:
+    file_path (str): The file to copy.
+    file_name (str): The name of the file.
+    destination_folder (str): The folder collecting files of this type.
+    file_type (str): 'CSV' or 'PDF', for logging.
+    """
+    try:
+        fast_copy(file_path, os.path.join(destination_folder, file_name))
+        log_message(f"Copied {file_type} file '{file_path}' to '{destination_folder}'.")
+        update_progress()
+
+    except FileNotFoundError as e:
+        log_message(f"Error: File not found '{e.filename}'. Skipping...")
+
+    except shutil.Error as e:
+        log_message(f"Error while copying '{file_path}': {e}. Skipping...")
+
+    except Exception as e:
+        log_message(f"Unexpected error '{e}' occurred with '{file_path}'. Skipping...")
+
+def collect_source_files(source_folder, merged_folders):
+    """
+    Walks the source folders and subfolders once, copying the .csv and .pdf files to their
+    folders in the merged directory and collecting the .zip files to extract afterwards.
+    A subfolder that cannot be read is logged and skipped, so the walk always completes.
+
+    Parameters:
+    source_folder (str): The original folder selected by the user.
+    merged_folders (dict): The folder and file type collecting each merged file extension.
+
+    Returns:
+    list: The .zip files found by the walk.
+    """
+    source_zip_paths = []
+
+    # Copier threads take files from a bounded queue while this thread is still walking,
+    # so listing directories overlaps with copying and many small copies overlap each other
+    copy_queue = queue.Queue(maxsize=COPY_QUEUE_SIZE)
+
+    def copier():
+        while True:
+            job = copy_queue.get()
+            if job is None:
+                break
+            copy_to_merged_folder(*job)
+
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+        for _ in range(COPY_WORKERS):
+            executor.submit(copier)
+
+        try:
+            # Walk through all folders and subfolders to find .csv, .pdf and .zip files
+            for file_path, file_name in iter_source_files(source_folder):
+                extension = file_extension(file_name)
+                merged_folder = merged_folders.get(extension)
+
+                if merged_folder is not None:
+                    extend_progress(1)
+                    copy_queue.put((file_path, file_name, *merged_folder))
+                elif extension in ZIP_EXTENSIONS:
+                    source_zip_paths.append(file_path)
+        finally:
+            # Stop the copiers once the queue is drained, even if the walk failed
+            for _ in range(COPY_WORKERS):
+                copy_queue.put(None)
+
+    return source_zip_paths
 
 def log_message(message):
     """
     Logs a message to the text widget in the GUI.
+    Safe to call from any thread, the message is shown by the next _drain_updates run.
 
     Parameters:
     message (str): The message to log.
     """
-    log_text.config(state=tk.NORMAL)
-    log_text.insert(tk.END, message + '\n')
-    log_text.config(state=tk.DISABLED)
-    log_text.see(tk.END)
+    log_queue.put(message)
 
 def update_progress():
     """
-    Updates the progress bar to reflect the progress of the tasks.
+    Records a completed task for the progress bar.
     """
-    progress_bar['value'] += 1
-    root.update_idletasks()
+    global completed_tasks
+    with progress_lock:
+        completed_tasks += 1
 
-def calculate_total_tasks(extraction_base_path):
+def extend_progress(task_count):
     """
-    Calculates the total number of tasks for copying and extracting files.
+    Raises the progress bar maximum as new tasks are discovered.
 
     Parameters:
-    extraction_base_path (str): The base path where extracted folders are located.
+    task_count (int): The number of newly discovered tasks.
+    """
+    global total_tasks
+    with progress_lock:
+        total_tasks += task_count
 
-    Returns:
-    int: Total number of tasks.
+def reset_progress():
+    """
+    Resets the task counters and the progress bar for a new run.
+    """
+    global completed_tasks, total_tasks
+    with progress_lock:
+        completed_tasks = total_tasks = 0
+    progress_bar['value'] = 0
+    progress_bar['maximum'] = 0
+
+def _drain_updates():
+    """
+    Shows all queued log messages with a single insert into the text widget and updates
+    the progress bar from the task counters, then schedules itself to run again.
+    Runs on the Tk thread.
+    """
+    messages = []
+    while True:
+        try:
+            messages.append(log_queue.get_nowait())
+        except queue.Empty:
+            break
+
+    if messages:
+        log_text.config(state=tk.NORMAL)
+        log_text.insert(tk.END, '\n'.join(messages) + '\n')
+        log_text.config(state=tk.DISABLED)
+        log_text.see(tk.END)
+
+    with progress_lock:
+        progress_bar['value'] = completed_tasks
+        progress_bar['maximum'] = total_tasks
+
+    root.after(100, _drain_updates)
+
+def process_folder(folder_path):
+    """
+    Runs the extraction and organization processes within the selected folder.
+    Runs on a worker thread so the GUI stays responsive.
+
+    Parameters:
+    folder_path (str): The folder selected by the user.
     """
-    total_tasks = 0
-    for root, _, files in os.walk(extraction_base_path):
-        for file_name in files:
-            if file_name.endswith('.zip') or file_name.endswith('.csv') or file_name.endswith('.pdf'):
-                total_tasks += 1
-    return total_tasks
+    # Define the path for the merged folder within the selected folder
+    merged_path = os.path.join(folder_path, MERGED_FOLDER_NAME)
+    merged_folders = create_merged_folders(merged_path)
+
+    # Organize the CSV and PDF files of the selected folder into the merged folder,
+    # noting the ZIP files found on the way
+    source_zip_paths = collect_source_files(folder_path, merged_folders)
+
+    # Extract the CSV and PDF files from those ZIP files
+    extract_zip_files(source_zip_paths, merged_folders)
 
 def select_folder_and_process():
     """
     Opens a file dialog for the user to select a folder and then runs the extraction
-    and organization processes within that folder.
+    and organization processes within that folder on a background thread.
     """
     # Open a file dialog for folder selection
     folder_path = filedialog.askdirectory(title="Select a Folder")
@@ -178,30 +554,31 @@ def select_folder_and_process():
         messagebox.showwarning("No Folder Selected", "Please select a folder to proceed.")
         return
 
-    # Define paths for extracted and merged folders within the selected folder
-    extraction_base_path = os.path.join(folder_path, 'Extracted')
-    merged_path = os.path.join(folder_path, 'Merged')
-
-    # Create the merged folder if it does not exist
-    if not os.path.exists(merged_path):
-        os.makedirs(merged_path)
+    # Reset the progress bar, its maximum grows as tasks are discovered
+    reset_progress()
 
-    # Copy original files and folders to the extraction base path
-    copy_to_extracted_folder(folder_path, extraction_base_path)
+    # Prevent a second run from starting while this one is in progress
+    select_button.config(state=tk.DISABLED)
 
-    # Calculate total tasks for the progress bar
-    total_tasks = calculate_total_tasks(extraction_base_path)
-    progress_bar['maximum'] = total_tasks
+    def finish(error):
+        select_button.config(state=tk.NORMAL)
+        if error is not None:
+            messagebox.showerror("Process Failed", f"An error occurred while processing: {error}")
+            return
+        # Display a success message
+        messagebox.showinfo("Process Complete", "Files have been extracted and organized successfully.")
+        log_message("Process completed successfully!")
 
-    # Run the extraction process within the extracted folder
-    find_and_extract_zip_files(extraction_base_path)
-
-    # Organize CSV and PDF files into the merged folder
-    organize_files_by_extension(extraction_base_path, merged_path)
+    def _worker():
+        try:
+            process_folder(folder_path)
+        except Exception as e:
+            log_message(f"Unexpected error '{e}' occurred while processing '{folder_path}'.")
+            root.after(0, finish, e)
+        else:
+            root.after(0, finish, None)
 
-    # Display a success message
-    messagebox.showinfo("Process Complete", "Files have been extracted and organized successfully.")
-    log_message("Process completed successfully!")
+    threading.Thread(target=_worker, daemon=True).start()
 
 # GUI setup using tkinter
 if __name__ == "__main__":
@@ -230,5 +607,9 @@ if __name__ == "__main__":
     progress_bar = ttk.Progressbar(root, orient='horizontal', mode='determinate', length=500)
     progress_bar.pack(pady=10)
 
+    # Queue of log messages from the worker threads, shown periodically on the Tk thread
+    log_queue = queue.Queue()
+    _drain_updates()
+
     # Run the tkinter main loop
     root.mainloop()